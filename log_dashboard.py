@@ -3,25 +3,74 @@ import sys
 import time
 import json
 import curses
-import threading
-import re
+import functools
+import heapq
+import itertools
+import selectors
+import signal
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List, Set
-from collections import deque
+
+try:
+    import inotify_simple
+except ImportError:  # Optional: fall back to polling the log files
+    inotify_simple = None
+
+@functools.lru_cache(maxsize=32)
+def box_borders(width: int) -> tuple:
+    """Return the top and bottom border strings for a box of the given width."""
+    inner = '─' * (width - 2)
+    return '┌' + inner + '┐', '└' + inner + '┘'
+
+timestamp_cache = [0, b'']
+
+def current_timestamp() -> bytes:
+    """Return the current wall-clock time as HH:MM:SS, formatted once per second."""
+    now = int(time.time())
+    if now != timestamp_cache[0]:
+        timestamp_cache[0] = now
+        timestamp_cache[1] = time.strftime('%H:%M:%S', time.localtime(now)).encode()
+    return timestamp_cache[1]
+
+def fit_line(line: bytes, width: int) -> tuple:
+    """Truncate a UTF-8 line to at most width characters.
+
+    Returns the truncated bytes and their length in characters. ASCII lines
+    are sliced directly; only other lines need decoding.
+    """
+    if line.isascii():
+        line = line[:width]
+        return line, len(line)
+    text = line.decode('utf-8', 'replace')[:width]
+    return text.encode('utf-8'), len(text)
 
 class LogMonitor:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.log_files = {}
+        self.titles = {}
         self.file_positions = {}
+        self.fds = {}
+        self.partial_lines = {}
+        self.read_size = 1 << 16
         self.log_buffers = {}
+        self.log_heads = {}
         self.error_buffers = {}  # New: separate buffer for error messages
+        self.error_heads = {}
+        self.dirty: Set[str] = set()  # Files with buffer changes not yet drawn
         self.buffer_size = 1000
         self.error_buffer_size = 500  # New: size for error buffer
         self.running = True
+        self.min_draw_interval = 0.016  # Cap redraws at roughly 60 per second
+        # Wakes the main loop when a signal arrives, see signal.set_wakeup_fd
+        self.wake_read, self.wake_write = os.pipe()
+        os.set_blocking(self.wake_read, False)
+        os.set_blocking(self.wake_write, False)
+        self.min_poll_interval = 0.01
+        self.max_poll_interval = 0.1
+        self.watches = {}  # inotify watch descriptor -> {file name: log name}
         self.current_view = 'logs'  # New: toggle between 'logs' and 'errors'
-        self.error_pattern = re.compile(r'error', re.IGNORECASE)  # New: pattern for matching errors
+        self.error_keyword = b'error'  # New: case-insensitive keyword for matching errors
         self.load_config()
 
     def load_config(self) -> None:
@@ -37,75 +86,250 @@ class LogMonitor:
             print(f"Error loading config: {e}")
             sys.exit(1)
 
-        # Initialize buffers and positions
-        for name in self.log_files:
-            self.log_buffers[name] = deque(maxlen=self.buffer_size)
-            self.error_buffers[name] = deque(maxlen=self.error_buffer_size)  # New: error buffer
+        # Initialize titles, buffers and positions
+        for name, path in self.log_files.items():
+            self.titles[name] = f" {name} - {path} ".encode()
+            self.log_buffers[name] = [None] * self.buffer_size
+            self.log_heads[name] = 0
+            self.error_buffers[name] = [None] * self.error_buffer_size  # New: error buffer
+            self.error_heads[name] = 0
             self.file_positions[name] = 0
-
-    def is_error_message(self, line: str) -> bool:
-        """Check if a line contains an error message."""
-        return bool(self.error_pattern.search(line))
-
-    def monitor_file(self, name: str, path: Path) -> None:
-        """Monitor a single log file for changes."""
-        while self.running:
+            self.partial_lines[name] = b''
+
+    def buffer_append(self, buffers: Dict[str, list], heads: Dict[str, int],
+                      name: str, entry) -> None:
+        """Append an entry to a ring buffer, overwriting the oldest one."""
+        ring = buffers[name]
+        head = heads[name]
+        ring[head % len(ring)] = entry
+        heads[name] = head + 1
+        self.dirty.add(name)
+
+    def buffer_extend(self, buffers: Dict[str, list], heads: Dict[str, int],
+                      name: str, entries: list) -> None:
+        """Append several entries to a ring buffer at once."""
+        if not entries:
+            return
+        ring = buffers[name]
+        size = len(ring)
+
+        # Only the newest size entries would survive anyway
+        head = heads[name] + max(0, len(entries) - size)
+        entries = entries[-size:]
+
+        # Copy in at most two slices, wrapping at the end of the ring
+        start = head % size
+        first = min(len(entries), size - start)
+        ring[start:start + first] = entries[:first]
+        ring[:len(entries) - first] = entries[first:]
+        heads[name] = head + len(entries)
+        self.dirty.add(name)
+
+    def buffer_tail(self, buffers: Dict[str, list], heads: Dict[str, int],
+                    name: str, count: int) -> list:
+        """Return the newest count entries of a ring buffer, oldest first."""
+        ring = buffers[name]
+        size = len(ring)
+        head = heads[name]
+        start = max(0, head - count, head - size)
+        if start == head:
+            return []
+
+        # The tail is at most two contiguous slices of the ring
+        begin, end = start % size, head % size
+        if begin < end:
+            return ring[begin:end]
+        return ring[begin:] + ring[:end]
+
+    def buffer_reversed(self, buffers: Dict[str, list],
+                        heads: Dict[str, int], name: str):
+        """Iterate over the entries of a ring buffer, newest first."""
+        ring = buffers[name]
+        size = len(ring)
+        head = heads[name]
+        for i in range(head - 1, max(head - size, 0) - 1, -1):
+            yield ring[i % size]
+
+    def buffer_count(self, buffers: Dict[str, list], heads: Dict[str, int],
+                     name: str) -> int:
+        """Return the number of entries held in a ring buffer."""
+        return min(heads[name], len(buffers[name]))
+
+    def take_dirty(self) -> Set[str]:
+        """Return and reset the names of files changed since the last call."""
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def open_file(self, name: str, path: Path) -> int:
+        """Open a log file and position it where the last read stopped."""
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        os.lseek(fd, self.file_positions[name], os.SEEK_SET)
+
+        # Logs are read once, front to back: ask for more readahead and let
+        # the kernel drop the pages after they have been read
+        if hasattr(os, 'posix_fadvise'):
             try:
-                if not path.exists():
-                    time.sleep(1)
-                    continue
-
-                with open(path, 'r') as f:
-                    f.seek(self.file_positions[name])
-                    new_lines = f.readlines()
-                    if new_lines:
-                        for line in new_lines:
-                            timestamp = datetime.now().strftime('%H:%M:%S')
-                            formatted_line = f"[{timestamp}] {line.strip()}"
-                            self.log_buffers[name].append(formatted_line)
-
-                            # Check for errors and add to error buffer if found
-                            if self.is_error_message(line):
-                                self.error_buffers[name].append(
-                                    f"[{timestamp}] {name}: {line.strip()}"
-                                )
-
-                        self.file_positions[name] = f.tell()
-                time.sleep(0.1)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
+            except OSError:
+                pass  # Only a hint; e.g. not supported for pipes
+        self.fds[name] = fd
+        return fd
+
+    def poll_file(self, name: str, path: Path) -> bool:
+        """Read any lines appended to a log file since the last poll.
+
+        Returns True if new lines were read.
+        """
+        fd = self.fds.get(name)
+        if fd is None:
+            if not path.exists():
+                return False
+            fd = self.open_file(name, path)
+
+        stat = os.fstat(fd)
+        if stat.st_size < self.file_positions[name]:
+            # File was truncated; start again from the beginning
+            os.lseek(fd, 0, os.SEEK_SET)
+            self.file_positions[name] = 0
+            self.partial_lines[name] = b''
+        elif stat.st_size == self.file_positions[name]:
+            # Nothing new; reopen from the start if the file was rotated
+            try:
+                rotated = os.stat(path).st_ino != stat.st_ino
+            except FileNotFoundError:
+                rotated = False
+            if not rotated:
+                return False
+            self.close_file(name)
+            self.file_positions[name] = 0
+            self.partial_lines[name] = b''
+            return self.poll_file(name, path)
+
+        chunks = []
+        while True:
+            chunk = os.read(fd, self.read_size)
+            chunks.append(chunk)
+            if len(chunk) < self.read_size:
+                break
+        data = b''.join(chunks)
+        self.file_positions[name] += len(data)
+
+        # Hold back a trailing partial line until the rest of it is written
+        new_lines = (self.partial_lines[name] + data).split(b'\n')
+        self.partial_lines[name] = new_lines.pop()
+        if not new_lines:
+            return False
+
+        # Classify and format the whole batch with comprehensions rather
+        # than a per-line loop; this is the hot path for busy logs
+        prefix = b'[' + current_timestamp() + b'] '
+        error_prefix = prefix + name.encode() + b': '
+        keyword = self.error_keyword
+        lines = [line.strip() for line in new_lines]
+        is_error = [keyword in line.lower() for line in lines]
+        self.buffer_extend(
+            self.log_buffers, self.log_heads, name,
+            [(flag, prefix + line) for flag, line in zip(is_error, lines)]
+        )
+
+        # Add errors to the error buffer as well
+        self.buffer_extend(
+            self.error_buffers, self.error_heads, name,
+            [error_prefix + line for line in itertools.compress(lines, is_error)]
+        )
+        return True
+
+    def poll_files(self, names, retry_at: Dict[str, float]) -> bool:
+        """Poll the named log files, backing off from files that fail to read.
+
+        Returns True if any file had new lines.
+        """
+        now = time.time()
+        active = False
+        for name in names:
+            if retry_at.get(name, 0) > now:
+                continue
+            try:
+                active |= self.poll_file(name, self.log_files[name])
+                retry_at.pop(name, None)
             except Exception as e:
-                error_msg = f"Error reading file: {e}"
-                self.log_buffers[name].append(error_msg)
-                self.error_buffers[name].append(error_msg)
-                time.sleep(1)
+                # Prefix like any other line so the error view stays in
+                # timestamp order
+                error_msg = f"Error reading file: {e}".encode()
+                prefix = b'[' + current_timestamp() + b'] '
+                self.buffer_append(self.log_buffers, self.log_heads, name,
+                                   (True, prefix + error_msg))
+                self.buffer_append(self.error_buffers, self.error_heads, name,
+                                   prefix + name.encode() + b': ' + error_msg)
+                self.close_file(name)
+                retry_at[name] = now + 1
+        return active
+
+    def create_watcher(self):
+        """Watch the log files with inotify, if it is available.
+
+        The parent directories are watched rather than the files themselves
+        so that files which are rotated or created later are still seen.
+        Returns None when the files have to be polled instead.
+        """
+        if inotify_simple is None:
+            return None
+        try:
+            watcher = inotify_simple.INotify()
+        except OSError:
+            return None
+
+        flags = inotify_simple.flags
+        mask = flags.MODIFY | flags.CREATE | flags.MOVED_TO
+        try:
+            for name, path in self.log_files.items():
+                wd = watcher.add_watch(path.parent, mask)
+                self.watches.setdefault(wd, {})[path.name] = name
+        except OSError:
+            # e.g. a log directory is missing; fall back to polling
+            watcher.close()
+            self.watches.clear()
+            return None
+        return watcher
+
+    def changed_files(self, watcher) -> Set[str]:
+        """Return the names of the log files inotify has reported changes to."""
+        return {
+            self.watches[event.wd][event.name]
+            for event in watcher.read(timeout=0)
+            if event.name in self.watches.get(event.wd, ())
+        }
+
+    def close_file(self, name: str) -> None:
+        """Close the open handle for a log file, if any."""
+        fd = self.fds.pop(name, None)
+        if fd is not None:
+            os.close(fd)
 
     def start_monitoring(self) -> None:
         """Start monitoring all configured log files."""
-        threads = []
-        for name, path in self.log_files.items():
-            thread = threading.Thread(
-                target=self.monitor_file,
-                args=(name, path),
-                daemon=True
-            )
-            threads.append(thread)
-            thread.start()
-
         try:
             self.display_dashboard()
         except KeyboardInterrupt:
+            pass
+        finally:
             self.running = False
-            for thread in threads:
-                thread.join()
+            for name in list(self.fds):
+                self.close_file(name)
+            os.close(self.wake_read)
+            os.close(self.wake_write)
 
     def display_dashboard(self) -> None:
         """Display the ASCII dashboard using curses."""
         def draw_box(win, y: int, x: int, height: int, width: int) -> None:
             """Draw a box with ASCII characters."""
-            win.addstr(y, x, '┌' + '─' * (width - 2) + '┐')
+            top, bottom = box_borders(width)
+            win.addstr(y, x, top)
             for i in range(1, height - 1):
                 win.addstr(y + i, x, '│')
                 win.addstr(y + i, x + width - 1, '│')
-            win.addstr(y + height - 1, x, '└' + '─' * (width - 2) + '┘')
+            win.addstr(y + height - 1, x, bottom)
 
         def init_colors() -> None:
             """Initialize color pairs."""
@@ -116,106 +340,263 @@ class LogMonitor:
             curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)      # Errors
             curses.init_pair(5, curses.COLOR_WHITE, curses.COLOR_RED)      # Error count
 
-        def display_logs(stdscr, height: int, width: int) -> None:
-            """Display regular log view."""
+            # Attributes used for every pane redraw, combined once here
+            self.title_attr = curses.color_pair(2)
+            self.error_attr = curses.color_pair(4)
+            self.error_line_attr = curses.color_pair(4) | curses.A_BOLD
+            self.error_badge_attr = curses.color_pair(5) | curses.A_BOLD
+
+        panes = {}
+        badges = {}  # name -> (error head, badge) as of the last count
+
+        def layout_panes(stdscr, height: int, width: int) -> None:
+            """Work out where each log file's box goes and create its content window."""
+            panes.clear()
             log_height = (height - 4) // len(self.log_files)
             current_y = 2
 
-            for name, path in self.log_files.items():
+            for name in self.log_files:
+                content = None
+                if log_height > 3 and width > 4:
+                    # One spare column so a full-width line never wraps
+                    content = stdscr.derwin(log_height - 3, width - 3,
+                                            current_y + 1, 2)
+                panes[name] = (current_y, log_height, content)
+                current_y += log_height
+
+        def display_logs(stdscr, width: int, names) -> None:
+            """Display regular log view for the given files."""
+            title_attr = self.title_attr
+            error_line_attr = self.error_line_attr
+            error_badge_attr = self.error_badge_attr
+
+            for name in names:
+                current_y, log_height, content = panes[name]
                 draw_box(stdscr, current_y, 0, log_height, width)
 
-                # Display log file name, path, and error count
-                error_count = len(self.error_buffers[name])
-                title = f" {name} - {path} "
-                error_badge = f" {error_count} errors " if error_count > 0 else ""
+                # Display log file name, path, and error count; the badge is
+                # only rebuilt when new errors have arrived
+                error_head = self.error_heads[name]
+                if badges.get(name, (None,))[0] != error_head:
+                    error_count = self.buffer_count(self.error_buffers,
+                                                    self.error_heads, name)
+                    badges[name] = (error_head, f" {error_count} errors ".encode()
+                                    if error_count > 0 else b"")
+                error_badge = badges[name][1]
+
+                stdscr.addstr(current_y, 2, self.titles[name], title_attr)
+                if error_badge:
+                    # The badge follows the title at the cursor position
+                    stdscr.addstr(error_badge, error_badge_attr)
+
+                if content is None:
+                    continue
 
-                stdscr.addstr(current_y, 2, title, curses.color_pair(2))
-                if error_count > 0:
-                    stdscr.addstr(current_y, len(title) + 2, error_badge,
-                                curses.color_pair(5) | curses.A_BOLD)
+                # Display log content as one block, then highlight error
+                # messages in red
+                content.erase()
+                display_lines = self.buffer_tail(self.log_buffers, self.log_heads,
+                                                 name, log_height - 3)
+                fitted = [fit_line(line, width - 4) for _, line in display_lines]
+                try:
+                    content.addstr(0, 0, b'\n'.join(text for text, _ in fitted))
+                    # A line that wrapped (tabs, double-width characters)
+                    # leaves the cursor below the last line's row
+                    wrapped = content.getyx()[0] != len(fitted) - 1
+                except curses.error:
+                    wrapped = True
 
-                # Display log content
-                display_lines = list(self.log_buffers[name])[-log_height+3:]
-                for i, line in enumerate(display_lines):
-                    if current_y + i + 1 < height - 1:
+                if wrapped:
+                    # Draw line by line so each line starts on its own row;
+                    # clearing first drops any overflow from the line above
+                    content.erase()
+                    for i, (text, _) in enumerate(fitted):
                         try:
-                            # Highlight error messages in red
-                            if self.is_error_message(line):
-                                stdscr.addnstr(
-                                    current_y + i + 1, 2, line, width - 4,
-                                    curses.color_pair(4) | curses.A_BOLD
-                                )
-                            else:
-                                stdscr.addnstr(current_y + i + 1, 2, line, width - 4)
+                            content.move(i, 0)
+                            content.clrtoeol()
+                            content.addstr(text)
                         except curses.error:
                             pass
 
-                current_y += log_height
+                for i, (is_error, _) in enumerate(display_lines):
+                    if is_error:
+                        try:
+                            content.chgat(i, 0, fitted[i][1], error_line_attr)
+                        except curses.error:
+                            pass
+                content.noutrefresh()
 
         def display_errors(stdscr, height: int, width: int) -> None:
             """Display error view."""
-            # Combine all error messages from all files
-            all_errors = []
-            for name, errors in self.error_buffers.items():
-                all_errors.extend(list(errors))
-
-            # Sort errors by timestamp
-            all_errors.sort(reverse=True)
+            # Merge the newest errors from all files; each buffer is already
+            # in timestamp order, so only the visible rows are ever compared
+            merged = heapq.merge(
+                *(self.buffer_reversed(self.error_buffers, self.error_heads, name)
+                  for name in self.error_buffers),
+                reverse=True
+            )
+            all_errors = list(itertools.islice(merged, max(height - 5, 0)))
 
             # Display error summary
-            total_errors = sum(len(errors) for errors in self.error_buffers.values())
+            total_errors = sum(
+                self.buffer_count(self.error_buffers, self.error_heads, name)
+                for name in self.error_buffers
+            )
             summary = f" Error Summary (Total: {total_errors}) "
             draw_box(stdscr, 2, 0, height - 3, width)
-            stdscr.addstr(2, 2, summary, curses.color_pair(4) | curses.A_BOLD)
+            stdscr.addstr(2, 2, summary, self.error_line_attr)
 
             # Display errors
+            error_attr = self.error_attr
             for i, error in enumerate(all_errors):
                 if i + 4 < height - 1:
                     try:
-                        stdscr.addnstr(i + 4, 2, error, width - 4,
-                                     curses.color_pair(4))
+                        stdscr.addstr(i + 4, 2, fit_line(error, width - 4)[0],
+                                    error_attr)
                     except curses.error:
                         pass
 
         def main(stdscr):
             init_colors()
             curses.curs_set(0)
-            stdscr.timeout(100)
-
-            while self.running:
-                stdscr.clear()
-                height, width = stdscr.getmaxyx()
-
-                # Draw header
-                header = " Log File Monitor "
-                stdscr.addstr(0, (width - len(header)) // 2, header,
-                            curses.color_pair(1) | curses.A_BOLD)
-
-                # Display monitoring status and instructions
-                status = f"Monitoring {len(self.log_files)} files"
-                stdscr.addstr(1, 2, status, curses.color_pair(2))
-
-                instructions = "Press 'q' to quit | 'e' to toggle error view"
-                stdscr.addstr(1, width - len(instructions) - 2, instructions,
-                            curses.color_pair(3))
-
-                # Display current view
-                if self.current_view == 'logs':
-                    display_logs(stdscr, height, width)
-                else:
-                    display_errors(stdscr, height, width)
-
-                stdscr.refresh()
+            stdscr.nodelay(True)
+            needs_layout = True
+            last_draw = 0.0
+
+            # curses only notices resizes inside getch(), which now runs only
+            # when there is input, so catch SIGWINCH here and wake the loop
+            resized = []
+            previous_sigwinch = signal.signal(
+                signal.SIGWINCH, lambda signum, frame: resized.append(signum)
+            )
+            signal.set_wakeup_fd(self.wake_write)
+
+            # A single loop waits for key presses, resizes and, with inotify,
+            # log file changes; without inotify the files are polled each
+            # time the wait times out
+            selector = selectors.DefaultSelector()
+            selector.register(sys.stdin, selectors.EVENT_READ)
+            selector.register(self.wake_read, selectors.EVENT_READ)
+            watcher = self.create_watcher()
+            if watcher is not None:
+                selector.register(watcher, selectors.EVENT_READ)
+
+            retry_at = {}
+            pending = set(self.log_files)
+            poll_interval = self.max_poll_interval
 
-                # Handle user input
-                try:
-                    key = stdscr.getch()
-                    if key == ord('q'):
-                        self.running = False
-                    elif key == ord('e'):
-                        self.current_view = 'errors' if self.current_view == 'logs' else 'logs'
-                except curses.error:
-                    pass
+            try:
+                while self.running:
+                    # Read new lines from the files that changed
+                    if watcher is None:
+                        active = self.poll_files(self.log_files, retry_at)
+
+                        # Poll quickly while files are being written, back
+                        # off when idle
+                        if active:
+                            poll_interval = self.min_poll_interval
+                        else:
+                            poll_interval = min(poll_interval * 2,
+                                                self.max_poll_interval)
+                        timeout = poll_interval
+                    else:
+                        self.poll_files(pending | retry_at.keys(), retry_at)
+                        pending = set()
+                        timeout = 1 if retry_at else None
+
+                    if resized:
+                        resized.clear()
+                        size = os.get_terminal_size(sys.__stdout__.fileno())
+                        curses.resizeterm(size.lines, size.columns)
+                        needs_layout = True
+
+                    # Redraw, letting bursts of updates collect into one frame
+                    if needs_layout or self.dirty:
+                        pause = last_draw + self.min_draw_interval - time.monotonic()
+                        if pause > 0:
+                            timeout = pause if timeout is None else min(timeout, pause)
+                        else:
+                            draw(stdscr, needs_layout, self.take_dirty())
+                            needs_layout = False
+                            last_draw = time.monotonic()
+
+                    # Sleep until a key is pressed, a file changes, the
+                    # terminal is resized or the timeout expires
+                    for key, _ in selector.select(timeout):
+                        if key.fileobj is watcher:
+                            pending |= self.changed_files(watcher)
+                        elif key.fileobj == self.wake_read:
+                            try:
+                                os.read(self.wake_read, 4096)
+                            except BlockingIOError:
+                                pass
+
+                    # Handle user input
+                    while True:
+                        try:
+                            key = stdscr.getch()
+                        except curses.error:
+                            break
+                        if key == -1:
+                            break
+                        if key == ord('q'):
+                            self.running = False
+                        elif key == ord('e'):
+                            self.current_view = 'errors' if self.current_view == 'logs' else 'logs'
+                            needs_layout = True
+                        elif key == curses.KEY_RESIZE:
+                            needs_layout = True
+            finally:
+                selector.close()
+                if watcher is not None:
+                    watcher.close()
+                signal.set_wakeup_fd(-1)
+                if previous_sigwinch is not None:
+                    signal.signal(signal.SIGWINCH, previous_sigwinch)
+
+        def draw(stdscr, needs_layout: bool, dirty: Set[str]) -> None:
+            """Redraw the screen.
+
+            Everything is redrawn when the screen size or view changed,
+            otherwise only the log panes that have new lines.
+            """
+            height, width = stdscr.getmaxyx()
+            if needs_layout:
+                draw_frame(stdscr, height, width)
+            elif self.current_view == 'logs':
+                display_logs(stdscr, width, dirty)
+                stdscr.noutrefresh()
+                curses.doupdate()
+            else:
+                draw_frame(stdscr, height, width)
+
+        def draw_frame(stdscr, height: int, width: int) -> None:
+            """Draw the header and current view in a single terminal update."""
+            stdscr.erase()
+
+            # Draw header
+            header = " Log File Monitor "
+            stdscr.addstr(0, (width - len(header)) // 2, header,
+                        curses.color_pair(1) | curses.A_BOLD)
+
+            # Display monitoring status and instructions
+            status = f"Monitoring {len(self.log_files)} files"
+            stdscr.addstr(1, 2, status, curses.color_pair(2))
+
+            instructions = "Press 'q' to quit | 'e' to toggle error view"
+            stdscr.addstr(1, width - len(instructions) - 2, instructions,
+                        curses.color_pair(3))
+
+            # Display current view
+            if self.current_view == 'logs':
+                layout_panes(stdscr, height, width)
+                display_logs(stdscr, width, self.log_files)
+            else:
+                display_errors(stdscr, height, width)
+
+            # Send only the changed cells to the terminal
+            stdscr.noutrefresh()
+            curses.doupdate()
 
         curses.wrapper(main)
 